@@ -1,72 +1,786 @@
-import os
-import comtypes.client
-from tqdm import tqdm
-import shutil
-
-def convert_to_pdf(input_dir, output_dir):
-    os.makedirs(output_dir, exist_ok=True)
-    ppt_app = comtypes.client.CreateObject("PowerPoint.Application")
-    ppt_app.Visible = True
-    word_app = comtypes.client.CreateObject("Word.Application")
-    word_app.Visible = True
-    files = [file for root, _, files in os.walk(input_dir) for file in files]
-
-    try:
-        for file in tqdm(files, desc="Converting files"):
-            input_path = os.path.join(input_dir, file)
-            output_path = os.path.join(output_dir, os.path.splitext(file)[0] + ".pdf")
-
-            if file.endswith(('.ppt', '.pptx')):
-                try:
-                    ppt = ppt_app.Presentations.Open(input_path)
-                    ppt.SaveAs(output_path, FileFormat=32)
-                    ppt.Close()
-                except Exception as e:
-                    print(f"Failed to convert {input_path}: {e}")
-
-            elif file.endswith(('.doc', '.docx')):
-                try:
-                    doc = word_app.Documents.Open(input_path)
-                    doc.SaveAs(output_path, FileFormat=17)
-                    doc.Close()
-                except Exception as e:
-                    print(f"Failed to convert {input_path}: {e}")
-
-            print(f"Converted {input_path} to {output_path}")
-    finally:
-        ppt_app.Quit()
-        word_app.Quit()
-
-def copy_existing_pdf(input_dir, output_dir):
-    for root, _, files in os.walk(input_dir):
-        for file in files:
-            if file.lower().endswith('.pdf'):
-                input_path = os.path.join(root, file)
-                output_path = os.path.join(output_dir, file)
-
-                if os.path.abspath(input_path) == os.path.abspath(output_path):
-                    print(f"Skipping {input_path} as it is the same as {output_path}")
-                    continue
-
-                shutil.copy(input_path, output_path)
-                print(f"Copied {input_path} to {output_path}")
-
-def main():
-    while True:
-        input_directory = input("Enter the input directory path: ")
-        if os.path.exists(input_directory):
-            break
-        print("Input directory does not exist. Please try again.")
-    
-    output_directory = os.path.join(input_directory, "converted_pdf")
-    if not os.path.exists(output_directory):
-        os.makedirs(output_directory)
-        print("Output directory created successfully.")
-    else:
-        print("Output directory already exists.")
-            
-    convert_to_pdf(input_directory, output_directory)
-    copy_existing_pdf(input_directory, output_directory)
-
-if __name__ == "__main__":
-    main()
+import argparse
+import atexit
+import hashlib
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
+import shutil
+import signal
+import sqlite3
+import sys
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Config:
+    MAX_WORKERS = min(os.cpu_count() or 1, 4)
+    COPY_WORKERS = 4
+    TASK_TIMEOUT = 300
+    TASK_RETRIES = 2
+    QUIET = False
+    PROGRESS_INTERVAL = 0.1
+    PPT_FORMAT_PDF = 32
+    WD_FORMAT_PDF = 17
+    WD_EXPORT_FORMAT_PDF = 17
+    PP_FIXED_FORMAT_PDF = 2
+    WD_ALERTS_NONE = 0
+    PP_ALERTS_NONE = 1
+    PPT_EXTENSIONS = ('.ppt', '.pptx')
+    WORD_EXTENSIONS = ('.doc', '.docx')
+    OUTPUT_DIR_NAME = "converted_pdf"
+    LOG_FILE = "conversion.log"
+    LOG_BUFFER_CAPACITY = 512
+
+
+# Task kinds carried as the first element of every task tuple, so the hot
+# paths dispatch on an int compare instead of repeated string work.
+TASK_COPY = 0
+TASK_CACHE_COPY = 1
+TASK_LINK_AFTER = 2
+TASK_PPT = 3
+TASK_WORD = 4
+
+
+class CacheStore:
+    DB_NAME = ".ppt2pdf_cache.sqlite"
+
+    def __init__(self, output_dir):
+        self.db_path = os.path.join(str(output_dir), self.DB_NAME)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS conversions "
+            "(fingerprint TEXT PRIMARY KEY, pdf_path TEXT, created REAL)")
+        self.conn.commit()
+
+    def get(self, fingerprint):
+        row = self.conn.execute(
+            "SELECT pdf_path FROM conversions WHERE fingerprint = ?",
+            (fingerprint,)).fetchone()
+        if row and os.path.exists(row[0]):
+            return row[0]
+        return None
+
+    def put(self, fingerprint, pdf_path):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO conversions VALUES (?, ?, ?)",
+            (fingerprint, str(pdf_path), time.time()))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+def _fast_copy(src, dst):
+    if sys.platform == 'win32':
+        import ctypes
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        if not kernel32.CopyFileExW(src, dst, None, None, None, 0):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        if hasattr(os, 'copy_file_range'):
+            try:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(),
+                                                remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            except OSError:
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+                shutil.copyfileobj(fsrc, fdst, length=4 * 1024 * 1024)
+        else:
+            shutil.copyfileobj(fsrc, fdst, length=4 * 1024 * 1024)
+    shutil.copystat(src, dst)
+
+
+# OOXML containers are zip archives; legacy .ppt/.doc are OLE2 compound files.
+_ZIP_MAGIC = b'PK\x03\x04'
+_OLE2_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+
+def _looks_convertible(path):
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(8)
+    except OSError:
+        return False
+    if head.startswith(_ZIP_MAGIC):
+        return zipfile.is_zipfile(path)
+    return head.startswith(_OLE2_MAGIC)
+
+
+def _fingerprint(path):
+    # The cache key includes mtime so edited files re-convert; the content
+    # key deliberately excludes it so byte-identical duplicates group.
+    st = os.stat(path)
+    with open(path, 'rb') as f:
+        digest = hashlib.sha1(f.read(1 << 20)).hexdigest()
+    return f"{st.st_size}:{int(st.st_mtime)}:{digest}", (st.st_size, digest)
+
+
+_PPT_TYPELIB = ('{91493440-5A91-11CF-8700-00AA0060263B}', 2, 12)
+_WORD_TYPELIB = ('{00020905-0000-0000-C000-000000000046}', 8, 7)
+
+# Imported into the Office VBA project when "Trust access to the VBA project
+# object model" is enabled, so Open+Export+Close run as one COM call instead
+# of three.
+_PPT_MACRO = '''Attribute VB_Name = "Ppt2PdfFuse"
+Sub ConvertPPT(inPath As String, outPath As String)
+    With Presentations.Open(inPath, ReadOnly:=True, Untitled:=False, WithWindow:=False)
+        .ExportAsFixedFormat outPath, 2
+        .Close
+    End With
+End Sub
+'''
+
+_WORD_MACRO = '''Attribute VB_Name = "Ppt2PdfFuse"
+Sub ConvertDoc(inPath As String, outPath As String)
+    With Documents.Open(inPath, ConfirmConversions:=False, ReadOnly:=True, Visible:=False)
+        .ExportAsFixedFormat outPath, 17
+        .Close False
+    End With
+End Sub
+'''
+
+_ppt_app = None
+_word_app = None
+_ppt_presentations = None
+_word_documents = None
+_ppt_macro_ok = False
+_word_macro_ok = False
+_saved_opts = {}
+_cache_stores = {}
+
+
+def _install_macro(app, source):
+    import tempfile
+    fd, path = tempfile.mkstemp(suffix=".bas")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(source)
+        app.VBE.ActiveVBProject.VBComponents.Import(path)
+        return True
+    except Exception:
+        return False
+    finally:
+        os.unlink(path)
+
+
+def _early_bound_interface(typelib, module_name):
+    # Application is the coclass; _Application is the dispatch interface with
+    # the _iid_ that CreateObject needs for early binding.
+    import comtypes.client
+    try:
+        comtypes.client.GetModule(typelib)
+        import comtypes.gen
+        return getattr(comtypes.gen, module_name)._Application
+    except Exception:
+        return None
+
+
+def _create_app(progid, typelib, module_name):
+    import comtypes.client
+    interface = _early_bound_interface(typelib, module_name)
+    if interface is not None:
+        try:
+            return comtypes.client.CreateObject(progid, interface=interface)
+        except Exception:
+            pass
+    return comtypes.client.CreateObject(progid)
+
+
+def _get_cache(output_dir):
+    cache = _cache_stores.get(output_dir)
+    if cache is None:
+        cache = CacheStore(output_dir)
+        _cache_stores[output_dir] = cache
+    return cache
+
+
+def _record_conversion(fingerprint, output_path):
+    # Cache bookkeeping only — a locked or read-only cache db must never turn
+    # a finished conversion into a reported failure.
+    try:
+        _get_cache(os.path.dirname(output_path)).put(fingerprint, output_path)
+    except Exception:
+        pass
+
+
+def _restore_opts():
+    if _ppt_app is not None and 'ppt_alerts' in _saved_opts:
+        try:
+            _ppt_app.DisplayAlerts = _saved_opts['ppt_alerts']
+        except Exception:
+            pass
+    if _word_app is not None:
+        for attr, key in (('ScreenUpdating', 'wd_screen'),
+                          ('DisplayAlerts', 'wd_alerts')):
+            if key in _saved_opts:
+                try:
+                    setattr(_word_app, attr, _saved_opts[key])
+                except Exception:
+                    pass
+        for attr, key in (('Pagination', 'wd_pagination'),
+                          ('CheckGrammarAsYouType', 'wd_grammar'),
+                          ('CheckSpellingAsYouType', 'wd_spelling')):
+            if key in _saved_opts:
+                try:
+                    setattr(_word_app.Options, attr, _saved_opts[key])
+                except Exception:
+                    pass
+
+
+def _shutdown_apps():
+    global _ppt_app, _word_app, _ppt_presentations, _word_documents
+    global _ppt_macro_ok, _word_macro_ok
+    _restore_opts()
+    for app in (_ppt_app, _word_app):
+        if app is not None:
+            try:
+                app.Quit()
+            except Exception:
+                pass
+    _ppt_app = None
+    _word_app = None
+    _ppt_presentations = None
+    _word_documents = None
+    _ppt_macro_ok = False
+    _word_macro_ok = False
+    _saved_opts.clear()
+
+
+def _get_ppt_app():
+    global _ppt_app
+    if _ppt_app is None:
+        app = _create_app("PowerPoint.Application", _PPT_TYPELIB, 'PowerPoint')
+        try:
+            _saved_opts['ppt_alerts'] = app.DisplayAlerts
+            app.DisplayAlerts = Config.PP_ALERTS_NONE
+        except Exception:
+            pass
+        global _ppt_macro_ok
+        _ppt_macro_ok = _install_macro(app, _PPT_MACRO)
+        _ppt_app = app
+        atexit.register(_shutdown_apps)
+    return _ppt_app
+
+
+def _get_word_app():
+    global _word_app
+    if _word_app is None:
+        app = _create_app("Word.Application", _WORD_TYPELIB, 'Word')
+        try:
+            _saved_opts['wd_screen'] = app.ScreenUpdating
+            _saved_opts['wd_alerts'] = app.DisplayAlerts
+            app.ScreenUpdating = False
+            app.DisplayAlerts = Config.WD_ALERTS_NONE
+            options = app.Options
+            _saved_opts['wd_pagination'] = options.Pagination
+            _saved_opts['wd_grammar'] = options.CheckGrammarAsYouType
+            _saved_opts['wd_spelling'] = options.CheckSpellingAsYouType
+            options.Pagination = False
+            options.CheckGrammarAsYouType = False
+            options.CheckSpellingAsYouType = False
+        except Exception:
+            pass
+        global _word_macro_ok
+        _word_macro_ok = _install_macro(app, _WORD_MACRO)
+        _word_app = app
+        atexit.register(_shutdown_apps)
+    return _word_app
+
+
+def _get_presentations():
+    global _ppt_presentations
+    if _ppt_presentations is None:
+        _ppt_presentations = _get_ppt_app().Presentations
+    return _ppt_presentations
+
+
+def _get_documents():
+    global _word_documents
+    if _word_documents is None:
+        _word_documents = _get_word_app().Documents
+    return _word_documents
+
+
+def _run_fused(app, macro, input_path, output_path):
+    # One app.Run round-trip instead of Open/Export/Close; on any failure the
+    # caller retries through the unfused path, which reports real errors.
+    global _ppt_macro_ok, _word_macro_ok
+    try:
+        app.Run(macro, input_path, output_path)
+        return True
+    except Exception:
+        if macro == "ConvertPPT":
+            _ppt_macro_ok = False
+        else:
+            _word_macro_ok = False
+        return False
+
+
+def _convert_one(task):
+    kind, input_path, output_path, fingerprint = task
+    try:
+        if kind == TASK_PPT:
+            if _ppt_macro_ok and _run_fused(_get_ppt_app(), "ConvertPPT",
+                                            input_path, output_path):
+                _record_conversion(fingerprint, output_path)
+                return input_path, output_path, True, None
+            pp_pdf, pp_fallback = Config.PP_FIXED_FORMAT_PDF, Config.PPT_FORMAT_PDF
+            presentation = _get_presentations().Open(input_path, Untitled=False,
+                                                     WithWindow=False)
+            try:
+                presentation.ExportAsFixedFormat(
+                    Path=output_path,
+                    FixedFormatType=pp_pdf,
+                    Intent=1,
+                    FrameSlides=False,
+                    RangeType=1,
+                    IncludeDocProperties=False,
+                    KeepIRM=False,
+                    DocStructureTags=False,
+                    BitmapMissingFonts=True,
+                    UseISO19005_1=False)
+            except AttributeError:
+                presentation.SaveAs(output_path, FileFormat=pp_fallback)
+            presentation.Close()
+        else:
+            if _word_macro_ok and _run_fused(_get_word_app(), "ConvertDoc",
+                                             input_path, output_path):
+                _record_conversion(fingerprint, output_path)
+                return input_path, output_path, True, None
+            wd_pdf, wd_fallback = Config.WD_EXPORT_FORMAT_PDF, Config.WD_FORMAT_PDF
+            document = _get_documents().Open(input_path,
+                                             ConfirmConversions=False)
+            try:
+                document.ExportAsFixedFormat(
+                    OutputFileName=output_path,
+                    ExportFormat=wd_pdf,
+                    OpenAfterExport=False,
+                    OptimizeFor=0,
+                    Range=0,
+                    Item=0,
+                    IncludeDocProps=False,
+                    KeepIRM=False,
+                    CreateBookmarks=0,
+                    DocStructureTags=False,
+                    BitmapMissingFonts=True,
+                    UseISO19005_1=False)
+            except AttributeError:
+                document.SaveAs(output_path, FileFormat=wd_fallback)
+            document.Close()
+    except Exception as e:
+        return input_path, output_path, False, str(e)
+    _record_conversion(fingerprint, output_path)
+    return input_path, output_path, True, None
+
+
+def _office_pids():
+    # COM spawns POWERPNT/WINWORD as separate OS processes; resolve their
+    # pids from the app windows so the supervisor can kill them if this
+    # worker is terminated and its cleanup never runs.
+    import ctypes
+    pids = []
+    for app in (_ppt_app, _word_app):
+        if app is None:
+            continue
+        try:
+            hwnd = app.HWND
+        except Exception:
+            try:
+                hwnd = app.ActiveWindow.Hwnd
+            except Exception:
+                continue
+        try:
+            pid = ctypes.c_ulong()
+            ctypes.windll.user32.GetWindowThreadProcessId(
+                hwnd, ctypes.byref(pid))
+            if pid.value:
+                pids.append(pid.value)
+        except Exception:
+            pass
+    return pids
+
+
+def _worker_loop(worker_id, task_queue, result_queue):
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+            # Bind the Office app for this task kind up front and report its
+            # pid before converting, so a hang on this very file is still
+            # attributable.
+            try:
+                if task[0] == TASK_PPT:
+                    _get_ppt_app()
+                else:
+                    _get_word_app()
+            except Exception:
+                pass
+            result_queue.put(('pids', worker_id, _office_pids()))
+            result_queue.put(('result', worker_id, _convert_one(task)))
+    finally:
+        _shutdown_apps()
+
+
+class WorkerPool:
+    def __init__(self, max_workers, task_timeout, max_retries):
+        self.max_workers = max_workers
+        self.task_timeout = task_timeout
+        self.max_retries = max_retries
+
+    def run(self, tasks, on_result):
+        pending = list(reversed(tasks))
+        remaining = len(tasks)
+        retries = {}
+        result_queue = multiprocessing.Queue()
+        workers = {}
+        next_id = 0
+
+        def spawn():
+            nonlocal next_id
+            wid = next_id
+            next_id += 1
+            task_queue = multiprocessing.Queue()
+            process = multiprocessing.Process(
+                target=_worker_loop, args=(wid, task_queue, result_queue),
+                daemon=True)
+            process.start()
+            workers[wid] = {'process': process, 'queue': task_queue,
+                            'task': None, 'deadline': None,
+                            'office_pids': []}
+            return wid
+
+        def assign(wid):
+            state = workers[wid]
+            if pending:
+                task = pending.pop()
+                state['task'] = task
+                state['deadline'] = time.monotonic() + self.task_timeout
+                state['queue'].put(task)
+
+        def emit(result):
+            nonlocal remaining
+            on_result(result)
+            remaining -= 1
+
+        def fail_or_retry(task, reason):
+            key = task[1]
+            retries[key] = retries.get(key, 0) + 1
+            if retries[key] > self.max_retries:
+                emit((task[1], task[2], False, reason))
+            else:
+                pending.append(task)
+
+        def kill_office(state):
+            # A terminated worker never runs its cleanup, so its COM-spawned
+            # Office processes would outlive it holding the stuck file open.
+            for pid in state['office_pids']:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError:
+                    pass
+
+        for _ in range(min(self.max_workers, len(pending))):
+            assign(spawn())
+
+        while remaining:
+            try:
+                tag, wid, payload = result_queue.get(timeout=0.5)
+            except queue.Empty:
+                wid = None
+            if wid is not None and wid in workers:
+                state = workers[wid]
+                if tag == 'pids':
+                    state['office_pids'] = payload
+                elif state['task'] is not None:
+                    state['task'] = None
+                    state['deadline'] = None
+                    emit(payload)
+                    assign(wid)
+            now = time.monotonic()
+            for wid, state in list(workers.items()):
+                task = state['task']
+                alive = state['process'].is_alive()
+                if task is None:
+                    continue
+                timed_out = now > state['deadline']
+                if not alive or timed_out:
+                    if alive:
+                        state['process'].terminate()
+                    state['process'].join(timeout=5)
+                    kill_office(state)
+                    del workers[wid]
+                    reason = ("conversion timed out"
+                              if timed_out else "worker process died")
+                    fail_or_retry(task, reason)
+                    if pending:
+                        assign(spawn())
+
+        for state in workers.values():
+            if state['process'].is_alive():
+                state['queue'].put(None)
+        for state in workers.values():
+            state['process'].join(timeout=10)
+            if state['process'].is_alive():
+                state['process'].terminate()
+                state['process'].join(timeout=5)
+                kill_office(state)
+
+
+class NullProgress:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def update(self, n=1):
+        pass
+
+
+class FileConverter:
+    HANDLERS = {**{ext: TASK_PPT for ext in Config.PPT_EXTENSIONS},
+                **{ext: TASK_WORD for ext in Config.WORD_EXTENSIONS},
+                '.pdf': TASK_COPY}
+
+    def __init__(self, config=None, log_file=None):
+        self.config = config or Config()
+        self.logger = logging.getLogger("ppt_to_pdf")
+        self._setup_logging(log_file or self.config.LOG_FILE)
+        if self.config.QUIET:
+            self._progress_factory = NullProgress
+            self._write = print
+        else:
+            from tqdm import tqdm
+            self._progress_factory = tqdm
+            self._write = tqdm.write
+
+    def _setup_logging(self, log_file):
+        if self.logger.handlers:
+            return
+        file_handler = logging.FileHandler(log_file, delay=True)
+        file_handler.setFormatter(logging.Formatter(
+            "%(asctime)s - %(levelname)s - %(message)s"))
+        buffered = logging.handlers.MemoryHandler(
+            capacity=self.config.LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR, target=file_handler)
+        self.logger.addHandler(buffered)
+        self.logger.setLevel(logging.INFO)
+        atexit.register(buffered.close)
+
+    def process_files(self, input_dir, output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+        tasks = self._identify_tasks(input_dir, output_dir)
+        self._process_tasks_with_progress(tasks)
+
+    def _identify_tasks(self, input_dir, output_dir):
+        tasks = []
+        cache = CacheStore(output_dir)
+        handlers = self.HANDLERS
+        out_dir = output_dir
+        out_abs = os.path.abspath(out_dir)
+        existing = ({name.lower() for name in os.listdir(out_dir)}
+                    if os.path.isdir(out_dir) else set())
+        # Outputs flatten into one directory, so names scheduled earlier in
+        # this same scan count as taken too.
+        scheduled = set()
+        seen = {}
+        try:
+            for root, dirs, names in os.walk(input_dir):
+                dirs[:] = [d for d in dirs
+                           if os.path.abspath(os.path.join(root, d)) != out_abs]
+                for name in names:
+                    stem, ext = os.path.splitext(name)
+                    kind = handlers.get(ext.lower())
+                    if kind is None:
+                        continue
+                    if kind == TASK_COPY:
+                        lower_name = name.lower()
+                        if lower_name in scheduled:
+                            self.logger.warning(
+                                "Skipping %s: output name %s already "
+                                "scheduled this run",
+                                os.path.join(root, name), name)
+                        elif lower_name not in existing:
+                            scheduled.add(lower_name)
+                            tasks.append((TASK_COPY, os.path.join(root, name),
+                                          os.path.join(out_dir, name)))
+                        continue
+                    pdf_name = stem + ".pdf"
+                    lower_pdf = pdf_name.lower()
+                    input_path = os.path.join(root, name)
+                    if lower_pdf in scheduled:
+                        self.logger.warning(
+                            "Skipping %s: output name %s already scheduled "
+                            "this run", input_path, pdf_name)
+                        continue
+                    if lower_pdf in existing:
+                        continue
+                    if not _looks_convertible(input_path):
+                        self._write(f"Skipping {input_path}: not a readable "
+                                    "Office file")
+                        self.logger.warning(
+                            "Skipping %s: not a readable Office file",
+                            input_path)
+                        continue
+                    output_path = os.path.join(out_dir, pdf_name)
+                    fingerprint, content_key = _fingerprint(input_path)
+                    cached_pdf = cache.get(fingerprint)
+                    scheduled.add(lower_pdf)
+                    if cached_pdf is not None:
+                        tasks.append((TASK_CACHE_COPY, cached_pdf, output_path))
+                    elif content_key in seen:
+                        tasks.append((TASK_LINK_AFTER, seen[content_key],
+                                      output_path))
+                    else:
+                        seen[content_key] = output_path
+                        tasks.append((kind, input_path, output_path,
+                                      fingerprint))
+        finally:
+            cache.close()
+        return tasks
+
+    def _process_tasks_with_progress(self, tasks):
+        convert_tasks = [t for t in tasks if t[0] in (TASK_PPT, TASK_WORD)]
+        copy_tasks = [t for t in tasks
+                      if t[0] in (TASK_COPY, TASK_CACHE_COPY)]
+        followers = {}
+        for _, leader_output, target in (t for t in tasks
+                                         if t[0] == TASK_LINK_AFTER):
+            followers.setdefault(leader_output, []).append(target)
+        with self._progress_factory(total=len(tasks),
+                                    desc="Converting files") as progress, \
+                ThreadPoolExecutor(max_workers=self.config.COPY_WORKERS) as copier:
+            copy_futures = [copier.submit(self._copy_file, task)
+                            for task in copy_tasks]
+            pending_updates = 0
+            last_render = time.monotonic()
+
+            def advance():
+                nonlocal pending_updates, last_render
+                pending_updates += 1
+                now = time.monotonic()
+                if now - last_render >= self.config.PROGRESS_INTERVAL:
+                    progress.update(pending_updates)
+                    pending_updates = 0
+                    last_render = now
+
+            if convert_tasks:
+                def handle_result(result):
+                    input_path, output_path, ok, error = result
+                    if ok:
+                        self.logger.info("Converted %s to %s",
+                                         input_path, output_path)
+                    else:
+                        self._write(f"Failed to convert {input_path}: {error}")
+                        self.logger.error("Failed to convert %s: %s",
+                                          input_path, error)
+                    advance()
+                    for target in followers.pop(output_path, ()):
+                        if (os.path.abspath(target)
+                                == os.path.abspath(output_path)):
+                            self.logger.warning(
+                                "Skipping duplicate %s: it is the leader's "
+                                "own output", target)
+                            advance()
+                            continue
+                        if ok:
+                            try:
+                                self._link_duplicate(output_path, target)
+                                self.logger.info("Linked duplicate %s to %s",
+                                                 output_path, target)
+                            except Exception as e:
+                                self._write(f"Failed to link {target}: {e}")
+                                self.logger.error("Failed to link %s: %s",
+                                                  target, e)
+                        else:
+                            self.logger.error(
+                                "Skipping duplicate %s: source conversion "
+                                "failed", target)
+                        advance()
+
+                pool = WorkerPool(
+                    min(self.config.MAX_WORKERS, len(convert_tasks)),
+                    self.config.TASK_TIMEOUT, self.config.TASK_RETRIES)
+                pool.run(convert_tasks, handle_result)
+            for task, future in zip(copy_tasks, copy_futures):
+                try:
+                    future.result()
+                    self.logger.info("Copied %s to %s", task[1], task[2])
+                except Exception as e:
+                    self._write(f"Failed to copy {task[1]}: {e}")
+                    self.logger.error("Failed to copy %s: %s", task[1], e)
+                advance()
+            if pending_updates:
+                progress.update(pending_updates)
+
+    def _link_duplicate(self, src, dst):
+        if os.path.abspath(src) == os.path.abspath(dst):
+            return
+        try:
+            os.link(src, dst)
+        except OSError:
+            _fast_copy(src, dst)
+
+    def _copy_file(self, task):
+        _, input_path, output_path = task
+        if os.path.abspath(input_path) == os.path.abspath(output_path):
+            self._write(f"Skipping {input_path} as it is the same as {output_path}")
+            return
+        _fast_copy(input_path, output_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Batch convert PPT, PPTX, DOC and DOCX files to PDF")
+    parser.add_argument("input_dir", nargs="?",
+                        help="directory containing files to convert "
+                             "(prompted for if omitted)")
+    parser.add_argument("-o", "--output-dir",
+                        help="destination directory "
+                             f"(default: <input_dir>/{Config.OUTPUT_DIR_NAME})")
+    parser.add_argument("-w", "--workers", type=int,
+                        default=Config.MAX_WORKERS,
+                        help="number of Office worker processes "
+                             "(default: %(default)s)")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="suppress the progress bar and per-file output")
+    parser.add_argument("--log-file", default=Config.LOG_FILE,
+                        help="conversion log path (default: %(default)s)")
+    args = parser.parse_args()
+
+    input_directory = args.input_dir
+    if input_directory is None:
+        while True:
+            input_directory = input("Enter the input directory path: ")
+            if os.path.exists(input_directory):
+                break
+            print("Input directory does not exist. Please try again.")
+    elif not os.path.exists(input_directory):
+        parser.error(f"input directory does not exist: {input_directory}")
+
+    output_directory = args.output_dir or os.path.join(
+        input_directory, Config.OUTPUT_DIR_NAME)
+
+    config = Config()
+    config.MAX_WORKERS = max(1, args.workers)
+    config.QUIET = args.quiet
+    converter = FileConverter(config, log_file=args.log_file)
+    converter.process_files(input_directory, output_directory)
+
+
+if __name__ == "__main__":
+    main()